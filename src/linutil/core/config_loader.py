@@ -5,9 +5,10 @@ Loads and merges YAML configuration files based on detected distribution.
 """
 
 import yaml
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from linutil.core.distro_detector import DistroInfo
 
@@ -28,7 +29,7 @@ TASK_PACKAGE_MANAGER = "MP"  # Package manager operations
 TASK_PRIVILEGED = "P*"  # Requires elevated privileges
 
 
-@dataclass
+@dataclass(slots=True)
 class AppDefinition:
     """Definition of an installable application."""
     
@@ -45,7 +46,7 @@ class AppDefinition:
         return pm in self.install or "flatpak" in self.install
 
 
-@dataclass
+@dataclass(slots=True)
 class TweakDefinition:
     """Definition of a system tweak."""
     
@@ -66,19 +67,57 @@ class TweakDefinition:
             self.dependencies = []
 
 
+# Fetches the required tweak keys in a single call
+_get_required_tweak_fields = itemgetter("id", "name", "description", "commands")
+
+
+def _make_tweak(tweak_data: dict[str, Any], section_name: str) -> TweakDefinition:
+    """
+    Build a TweakDefinition from its configuration data.
+    
+    Args:
+        tweak_data: Tweak entry from a tweaks configuration file
+        section_name: Name of the section containing the tweak
+        
+    Returns:
+        The tweak definition
+    """
+    tweak_id, name, description, commands = _get_required_tweak_fields(tweak_data)
+    get = tweak_data.get
+    return TweakDefinition(
+        id=tweak_id,
+        name=name,
+        description=description,
+        category=get("category", ""),
+        commands=commands,
+        requires_restart=get("requires_restart", False),
+        idempotent=get("idempotent", True),
+        dependencies=get("dependencies", []),
+        verification=get("verification"),
+        section=section_name,
+        task_list=get("task_list", TASK_INSTALL),
+    )
+
+
 @dataclass
 class AppConfig:
     """Application configuration."""
     
     categories: list[dict[str, Any]]
+    _definitions: list[tuple[dict[str, Any], list[AppDefinition]]] = field(
+        init=False, repr=False, compare=False
+    )
+    _prepared: dict[str, list[tuple[dict[str, Any], list[AppDefinition]]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
     
-    def get_all_apps(self) -> list[AppDefinition]:
-        """Get all applications as AppDefinition objects."""
-        apps = []
+    def __post_init__(self):
+        # Build every AppDefinition once, when the configuration is loaded
+        self._definitions = []
         for category in self.categories:
             cat_name = category.get("name", "")
-            for app_data in category.get("applications", []):
-                app = AppDefinition(
+            apps = [
+                AppDefinition(
                     id=app_data["id"],
                     name=app_data["name"],
                     description=app_data["description"],
@@ -87,8 +126,43 @@ class AppConfig:
                     category=cat_name,
                     task_list=app_data.get("task_list", TASK_INSTALL),
                 )
-                apps.append(app)
-        return apps
+                for app_data in category.get("applications", [])
+            ]
+            self._definitions.append((category, apps))
+    
+    def get_categories_for(
+        self,
+        package_manager: str
+    ) -> list[tuple[dict[str, Any], list[AppDefinition]]]:
+        """
+        Get each category with the applications usable with a package manager.
+        
+        The result is cached per package manager, so screens can be
+        composed repeatedly for free.
+        
+        Args:
+            package_manager: Package manager name (e.g., "apt", "dnf")
+            
+        Returns:
+            List of (category, applications) pairs, leaving out categories
+            with no usable applications
+        """
+        if package_manager not in self._prepared:
+            prepared = []
+            usable_methods = frozenset((package_manager, "flatpak"))
+            for category, apps in self._definitions:
+                usable = [
+                    app for app in apps
+                    if not usable_methods.isdisjoint(app.install)
+                ]
+                if usable:
+                    prepared.append((category, usable))
+            self._prepared[package_manager] = prepared
+        return self._prepared[package_manager]
+    
+    def get_all_apps(self) -> list[AppDefinition]:
+        """Get all applications as AppDefinition objects."""
+        return [app for _, apps in self._definitions for app in apps]
 
 
 @dataclass
@@ -98,32 +172,36 @@ class TweakConfig:
     sections: list[dict[str, Any]]
     distro: str = ""
     compatible_versions: list[str] = None
+    _definitions: list[tuple[dict[str, Any], list[TweakDefinition]]] = field(
+        init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         if self.compatible_versions is None:
             self.compatible_versions = []
+        
+        # Build every TweakDefinition once, when the configuration is loaded
+        self._definitions = []
+        for section in self.sections:
+            section_name = section.get("name", "")
+            tweaks = [
+                _make_tweak(tweak_data, section_name)
+                for tweak_data in section.get("tweaks", [])
+            ]
+            self._definitions.append((section, tweaks))
+    
+    def get_sections(self) -> list[tuple[dict[str, Any], list[TweakDefinition]]]:
+        """
+        Get each section with its tweaks as TweakDefinition objects.
+        
+        Returns:
+            List of (section, tweaks) pairs
+        """
+        return self._definitions
     
     def get_all_tweaks(self) -> list[TweakDefinition]:
         """Get all tweaks as TweakDefinition objects."""
-        tweaks = []
-        for section in self.sections:
-            section_name = section.get("name", "")
-            for tweak_data in section.get("tweaks", []):
-                tweak = TweakDefinition(
-                    id=tweak_data["id"],
-                    name=tweak_data["name"],
-                    description=tweak_data["description"],
-                    category=tweak_data.get("category", ""),
-                    commands=tweak_data["commands"],
-                    requires_restart=tweak_data.get("requires_restart", False),
-                    idempotent=tweak_data.get("idempotent", True),
-                    dependencies=tweak_data.get("dependencies", []),
-                    verification=tweak_data.get("verification"),
-                    section=section_name,
-                    task_list=tweak_data.get("task_list", TASK_INSTALL),
-                )
-                tweaks.append(tweak)
-        return tweaks
+        return [tweak for _, tweaks in self._definitions for tweak in tweaks]
 
 
 class ConfigLoader:
@@ -4,6 +4,7 @@ Terminal Executor Module
 Handles interactive terminal command execution with user input support.
 """
 
+import shlex
 import subprocess
 import sys
 from typing import Optional, List
@@ -40,11 +41,30 @@ class TerminalExecutor:
         import os
         return os.environ.get('SHELL', '/bin/bash')
     
+    def _background_command(self, cmd: str, use_sudo: bool) -> str:
+        """
+        Get the command line actually run for a background command.
+        
+        Background jobs must never prompt, so sudo runs non-interactively
+        using the credentials cached by the script's initial 'sudo -v'.
+        
+        Args:
+            cmd: Background command
+            use_sudo: Whether commands run with sudo
+            
+        Returns:
+            Command line as it appears in the script
+        """
+        if use_sudo and not cmd.strip().startswith('sudo'):
+            return f'sudo -n {cmd}'
+        return cmd
+    
     def execute_interactive(
         self,
         commands: List[str],
         use_sudo: bool = False,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        background_commands: Optional[List[str]] = None
     ) -> TerminalResult:
         """
         Execute commands interactively in the user's terminal.
@@ -52,14 +72,45 @@ class TerminalExecutor:
         This function will run the commands and allow full user interaction
         including password prompts, confirmations, and viewing output.
         
+        Background commands are started first and run concurrently with the
+        foreground commands; they must not need any input. Their output goes
+        to per-job log files so it does not mix with the foreground output,
+        and their status is reported once the foreground commands finish.
+        
         Args:
             commands: List of commands to execute
             use_sudo: Whether to use sudo (will prompt for password)
             description: Optional description to show before execution
+            background_commands: Independent commands to run concurrently
             
         Returns:
             TerminalResult with return code and success status
         """
+        script = self.build_script(commands, use_sudo, description, background_commands)
+        return self.execute_script(script)
+    
+    def build_script(
+        self,
+        commands: List[str],
+        use_sudo: bool = False,
+        description: Optional[str] = None,
+        background_commands: Optional[List[str]] = None
+    ) -> str:
+        """
+        Build a single shell script that runs all commands in order.
+        
+        Every command runs even if an earlier one fails; the script exits
+        with the last non-zero exit code, or 0 if everything succeeded.
+        
+        Args:
+            commands: List of commands to execute
+            use_sudo: Whether to prefix commands with sudo
+            description: Optional description to show before execution
+            background_commands: Independent commands to run concurrently
+            
+        Returns:
+            Script content for bash
+        """
         # Create a shell script to execute
         script_lines = ["#!/bin/bash"]
         # Don't use 'set -e' - we want to continue even if some commands fail
@@ -73,6 +124,39 @@ class TerminalExecutor:
         # Track overall success
         script_lines.append('OVERALL_SUCCESS=0')
         
+        # Start background commands, each logging to its own file
+        if background_commands:
+            if use_sudo:
+                # Ask for the password once up front so background jobs never prompt
+                script_lines.append('sudo -v')
+            script_lines.append('BG_LOG_DIR=$(mktemp -d -t linutil-XXXXXX)')
+            # On Ctrl+C, stop the background jobs (and the commands they
+            # started) before exiting, so nothing keeps running unseen
+            script_lines.append('BG_PIDS=""')
+            script_lines.append('stop_background_jobs() {')
+            script_lines.append('    echo ""')
+            script_lines.append('    echo "Cancelled, stopping background jobs..."')
+            script_lines.append('    for PID in $BG_PIDS; do')
+            script_lines.append('        CHILD_PIDS=$(pgrep -P $PID)')
+            script_lines.append('        kill $PID $CHILD_PIDS 2>/dev/null')
+            script_lines.append('    done')
+            script_lines.append('    wait')
+            script_lines.append('    exit 130')
+            script_lines.append('}')
+            script_lines.append('trap stop_background_jobs INT TERM')
+            for i, cmd in enumerate(background_commands, 1):
+                bg_cmd = self._background_command(cmd, use_sudo)
+                script_lines.append(
+                    f'{{ {bg_cmd}; }} > "$BG_LOG_DIR/background-{i}.log" 2>&1 < /dev/null &'
+                )
+                script_lines.append(f'BG_PID_{i}=$!')
+                script_lines.append('BG_PIDS="$BG_PIDS $!"')
+            script_lines.append(
+                f'echo "Started {len(background_commands)} background job(s), '
+                f'logging to $BG_LOG_DIR"'
+            )
+            script_lines.append('echo ""')
+        
         # Add commands
         for cmd in commands:
             if use_sudo and not cmd.strip().startswith('sudo'):
@@ -83,6 +167,23 @@ class TerminalExecutor:
             script_lines.append('CMD_EXIT=$?')
             script_lines.append('if [ $CMD_EXIT -ne 0 ]; then OVERALL_SUCCESS=$CMD_EXIT; fi')
         
+        # Wait for background commands and report how each one went
+        if background_commands:
+            script_lines.append('echo ""')
+            script_lines.append('echo "Waiting for background jobs..."')
+            for i, cmd in enumerate(background_commands, 1):
+                label = shlex.quote(self._background_command(cmd, use_sudo))
+                script_lines.append(f'wait $BG_PID_{i}')
+                script_lines.append('CMD_EXIT=$?')
+                script_lines.append('if [ $CMD_EXIT -eq 0 ]; then')
+                script_lines.append(f'    echo "  ✓ "{label}')
+                script_lines.append('else')
+                script_lines.append('    OVERALL_SUCCESS=$CMD_EXIT')
+                script_lines.append(f'    echo "  ✗ "{label}" (exit code $CMD_EXIT)"')
+                script_lines.append('fi')
+                script_lines.append(f'echo "    log: $BG_LOG_DIR/background-{i}.log"')
+            script_lines.append('trap - INT TERM')
+        
         # Always show completion message
         script_lines.append('echo ""')
         script_lines.append('echo "==================================="')
@@ -97,20 +198,40 @@ class TerminalExecutor:
         script_lines.append('read -p "Press Enter to continue..."')
         script_lines.append('exit $OVERALL_SUCCESS')
         
-        script_content = '\n'.join(script_lines)
+        return '\n'.join(script_lines)
+    
+    def execute_script(self, script: str) -> TerminalResult:
+        """
+        Run a complete shell script in the current terminal.
+        
+        The whole script runs in one bash process with the terminal's
+        stdin/stdout/stderr attached, so the user can interact with it.
         
+        Args:
+            script: Script content, e.g. from build_script()
+            
+        Returns:
+            TerminalResult with return code and success status
+        """
         # Execute in the current terminal
+        process = None
         try:
-            result = subprocess.run(
-                ['bash', '-c', script_content],
+            process = subprocess.Popen(
+                ['bash', '-c', script],
                 stdin=sys.stdin,
                 stdout=sys.stdout,
-                stderr=sys.stderr,
-                check=False
+                stderr=sys.stderr
             )
-            return TerminalResult.from_code(result.returncode)
+            return TerminalResult.from_code(process.wait())
         
         except KeyboardInterrupt:
+            # The script gets the same Ctrl+C; wait for it to stop its
+            # background jobs instead of leaving them running
+            while process is not None and process.poll() is None:
+                try:
+                    process.wait()
+                except KeyboardInterrupt:
+                    pass
             print("\n\nOperation cancelled by user.")
             return TerminalResult.from_code(130)  # SIGINT
         
@@ -123,7 +244,8 @@ class TerminalExecutor:
         commands: List[str],
         use_sudo: bool = False,
         description: Optional[str] = None,
-        warning: Optional[str] = None
+        warning: Optional[str] = None,
+        background_commands: Optional[List[str]] = None
     ) -> TerminalResult:
         """
         Execute commands with user confirmation.
@@ -133,6 +255,7 @@ class TerminalExecutor:
             use_sudo: Whether to use sudo
             description: Description of what will be done
             warning: Optional warning message
+            background_commands: Independent commands to run concurrently
             
         Returns:
             TerminalResult with return code and success status
@@ -148,6 +271,11 @@ class TerminalExecutor:
             prefix = "sudo " if use_sudo and not cmd.strip().startswith('sudo') else ""
             print(f"  {i}. {prefix}{cmd}")
         
+        if background_commands:
+            print("\nIn the background, at the same time (output is logged):\n")
+            for cmd in background_commands:
+                print(f"  • {self._background_command(cmd, use_sudo)}")
+        
         if warning:
             print(f"\n⚠️  WARNING: {warning}")
         
@@ -164,7 +292,7 @@ class TerminalExecutor:
             return TerminalResult.from_code(130)
         
         # Execute
-        return self.execute_interactive(commands, use_sudo, description)
+        return self.execute_interactive(commands, use_sudo, description, background_commands)
 
 
 if __name__ == "__main__":
@@ -18,7 +18,7 @@ from linutil.managers.base_manager import PackageManagerFactory
 from linutil.managers.apt_manager import AptManager
 from linutil.managers.dnf_manager import DnfManager
 from linutil.ui.screens.apps_screen import AppsScreen, APPS_SCREEN_CSS
-from linutil.ui.screens.tweaks_screen import TweaksScreen, TWEAKS_SCREEN_CSS
+from linutil.ui.screens.tweaks_screen import TweaksScreen
 from linutil.ui.tips import get_random_tip
 from linutil.ui.shortcuts import ShortcutGuide
 
@@ -26,6 +26,23 @@ from linutil.ui.shortcuts import ShortcutGuide
 MIN_WIDTH = 80
 MIN_HEIGHT = 24
 
+# System update commands for each supported package manager
+UPDATE_COMMANDS = {
+    'apt': [
+        'apt update',
+        'apt upgrade -y',
+        'apt autoremove -y',
+    ],
+    'dnf': [
+        'dnf check-update || true',  # Returns 100 if updates available
+        'dnf upgrade -y',
+        'dnf autoremove -y',
+    ],
+    'pacman': [
+        'pacman -Syu --noconfirm',
+    ],
+}
+
 
 class WelcomeScreen(Screen):
     """Welcome screen shown on startup."""
@@ -188,26 +205,9 @@ class UpdateScreen(Screen):
     
     def start_update(self) -> None:
         """Start system update interactively."""
-        # Build update command based on package manager
-        commands = []
-        
-        if self.package_manager == 'apt':
-            commands = [
-                'apt update',
-                'apt upgrade -y',
-                'apt autoremove -y'
-            ]
-        elif self.package_manager == 'dnf':
-            commands = [
-                'dnf check-update || true',  # Returns 100 if updates available
-                'dnf upgrade -y',
-                'dnf autoremove -y'
-            ]
-        elif self.package_manager == 'pacman':
-            commands = [
-                'pacman -Syu --noconfirm'
-            ]
-        else:
+        # Look up the update commands for the package manager
+        commands = UPDATE_COMMANDS.get(self.package_manager)
+        if commands is None:
             self.app.notify(f"Package manager {self.package_manager} not supported", severity="error")
             return
         
@@ -350,7 +350,7 @@ class LinUtilApp(App):
         text-style: bold;
         padding: 2;
     }
-    """ + APPS_SCREEN_CSS + TWEAKS_SCREEN_CSS
+    """ + APPS_SCREEN_CSS
     
     TITLE = "LinUtil - Linux Post-Install Setup"
     
@@ -6,45 +6,43 @@ Displays categorized applications with multi-select checkboxes.
 
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
-from textual.widgets import Header, Footer, Button, Static, Label, Checkbox
+from textual.widgets import Header, Footer, Button, Static, Label, SelectionList
+from textual.widgets.selection_list import Selection
 from textual.binding import Binding
 from textual.screen import Screen
-from textual.message import Message
 from textual import events
+from textual.message import Message
+from rich.text import Text
 
 from linutil.core.config_loader import AppConfig, AppDefinition
 from linutil.managers.base_manager import PackageManagerFactory, InstallResult
 from linutil.core.executor import PrivilegeHandler, CommandExecutor
 from linutil.core.terminal_executor import TerminalExecutor
 
+# Native install command template for each supported package manager
+PM_INSTALL_COMMANDS = {
+    'apt': 'apt install -y {}',
+    'dnf': 'dnf install -y {}',
+    'pacman': 'pacman -S --noconfirm {}',
+}
 
-class AppCheckbox(Horizontal):
-    """Custom checkbox widget for an application."""
-    
-    def __init__(self, app: AppDefinition, package_manager: str):
-        super().__init__()
-        self.app_def = app  # Renamed from 'app' to avoid conflict with Textual's .app property
-        self.package_manager = package_manager
-        self.checkbox = Checkbox("", id=f"app_{self.app_def.id}")  # Empty label for checkbox
-    
-    def compose(self) -> ComposeResult:
-        """Create child widgets."""
-        yield self.checkbox
-        yield Vertical(
-            Label(f"{self.app_def.name} [{self.app_def.task_list}]", classes="app-name"),
-            Label(self.app_def.description, classes="app-description"),
-        )
-    
-    def on_click(self, event: events.Click) -> None:
-        """Toggle checkbox when clicking anywhere on the row except the checkbox itself."""
-        # Check if the click was on the checkbox widget itself
-        if event.widget is self.checkbox:
-            # Let the checkbox handle it naturally
-            return
-        
-        # Otherwise, toggle the checkbox
-        self.checkbox.toggle()
-        event.stop()  # Prevent event bubbling
+
+def app_prompt(app: AppDefinition) -> Text:
+    """Build the list entry shown for an application."""
+    return Text.assemble(
+        (f"{app.name} [{app.task_list}]", "bold"),
+        "  ",
+        (app.description, "italic dim"),
+    )
+
+
+def app_details(app: AppDefinition) -> Text:
+    """Build the full description shown for the highlighted application."""
+    return Text.assemble(
+        (app.name, "bold"),
+        f" [{app.task_list}]\n",
+        (app.description, "italic"),
+    )
 
 
 class AppsScreen(Screen):
@@ -69,9 +67,18 @@ class AppsScreen(Screen):
         self.package_manager = package_manager
         self.privilege_handler = privilege_handler
         self.selected_apps: list[AppDefinition] = []
+        # Selection state lives in one SelectionList per category; rows are
+        # rendered line by line instead of being mounted as widgets.
+        self._app_lists: list[SelectionList[str]] = []
+        self._app_entries: dict[str, AppDefinition] = {}
     
     def compose(self) -> ComposeResult:
         """Create child widgets."""
+        self._app_details = Static(
+            "Highlight an application to see its full description.",
+            id="app-details"
+        )
+        
         yield Header()
         
         yield Container(
@@ -96,6 +103,9 @@ class AppsScreen(Screen):
                     id="apps-container"
                 ),
                 
+                # Full description of the highlighted application
+                self._app_details,
+                
                 # Bottom buttons
                 Horizontal(
                     Button("◀ Back", id="btn-back", variant="default"),
@@ -109,11 +119,15 @@ class AppsScreen(Screen):
         
         yield Footer()
     
-    def _create_app_categories(self) -> list[Static | AppCheckbox]:
+    def _create_app_categories(self) -> list[Static | Label | SelectionList[str]]:
         """Create widgets for all app categories."""
         widgets = []
+        self._app_lists = []
+        self._app_entries = {}
         
-        if not self.apps_config.categories:
+        categories = self.apps_config.get_categories_for(self.package_manager)
+        
+        if not categories:
             widgets.append(
                 Static(
                     "No applications available for your distribution yet.",
@@ -122,11 +136,10 @@ class AppsScreen(Screen):
             )
             return widgets
         
-        for category in self.apps_config.categories:
+        for category, apps in categories:
             # Category header
             icon = category.get('icon', '📦')
             name = category.get('name', 'Unknown')
-            apps = category.get('applications', [])
             
             widgets.append(
                 Label(
@@ -136,20 +149,14 @@ class AppsScreen(Screen):
             )
             
             # Apps in this category
-            for app_data in apps:
-                app = AppDefinition(
-                    id=app_data["id"],
-                    name=app_data["name"],
-                    description=app_data["description"],
-                    install=app_data["install"],
-                    tags=app_data.get("tags", []),
-                    category=name,
-                )
-                
-                # Only show apps that support this package manager or flatpak
-                if (self.package_manager in app.install or 
-                    "flatpak" in app.install):
-                    widgets.append(AppCheckbox(app, self.package_manager))
+            selections = []
+            for app in apps:
+                self._app_entries[app.id] = app
+                selections.append(Selection(app_prompt(app), app.id))
+            
+            app_list = SelectionList[str](*selections, classes="app-list")
+            self._app_lists.append(app_list)
+            widgets.append(app_list)
         
         return widgets
     
@@ -167,17 +174,40 @@ class AppsScreen(Screen):
             self.action_install()
     
     def action_select_all(self) -> None:
-        """Select all application checkboxes."""
-        for checkbox in self.query(Checkbox):
-            checkbox.value = True
+        """Select all applications."""
+        with self.app.batch_update():
+            for app_list in self._app_lists:
+                app_list.select_all()
         self.app.notify("All applications selected", severity="information")
     
     def action_select_none(self) -> None:
-        """Deselect all application checkboxes."""
-        for checkbox in self.query(Checkbox):
-            checkbox.value = False
+        """Deselect all applications."""
+        with self.app.batch_update():
+            for app_list in self._app_lists:
+                app_list.deselect_all()
         self.app.notify("All selections cleared", severity="information")
     
+    def _show_app_details(self, app_list: SelectionList[str]) -> None:
+        """Show the full description of a list's highlighted application."""
+        if app_list.highlighted is None:
+            return
+        app_id = app_list.get_option_at_index(app_list.highlighted).value
+        details = app_details(self._app_entries[app_id])
+        self._app_details.update(details)
+    
+    def on_selection_list_selection_highlighted(
+        self,
+        event: SelectionList.SelectionHighlighted
+    ) -> None:
+        """Follow the highlight in the focused list."""
+        if event.selection_list.has_focus:
+            self._show_app_details(event.selection_list)
+    
+    def on_descendant_focus(self, event: events.DescendantFocus) -> None:
+        """Show the highlighted application when a list gains focus."""
+        if isinstance(event.widget, SelectionList):
+            self._show_app_details(event.widget)
+    
     def action_pop_screen(self) -> None:
         """Go back to previous screen."""
         self.app.pop_screen()
@@ -189,11 +219,11 @@ class AppsScreen(Screen):
     def action_install(self) -> None:
         """Install selected applications interactively."""
         # Collect selected apps
-        selected = []
-        
-        for app_checkbox in self.query(AppCheckbox):
-            if app_checkbox.checkbox.value:
-                selected.append(app_checkbox.app_def)
+        selected = [
+            self._app_entries[app_id]
+            for app_list in self._app_lists
+            for app_id in app_list.selected
+        ]
         
         if not selected:
             self.app.notify(
@@ -210,12 +240,24 @@ class AppsScreen(Screen):
             timeout=3
         )
         
-        # Prepare installation commands
+        # Prepare installation commands. Native packages and custom commands
+        # run one after another (the package manager holds a lock), while
+        # flatpak-only apps install in the background alongside them.
         commands = []
         packages = []
+        flatpak_refs: dict[str, list[str]] = {}
         
         for app in selected:
-            install_info = app.install.get(self.package_manager, {})
+            install_info = app.install.get(self.package_manager)
+            
+            if install_info is None:
+                # Only available as a flatpak
+                flatpak_info = app.install.get('flatpak', {})
+                if flatpak_info.get('id'):
+                    remote = flatpak_info.get('remote', 'flathub')
+                    flatpak_refs.setdefault(remote, []).append(flatpak_info['id'])
+                continue
+            
             method = install_info.get('method', 'native')
             
             if method == 'native':
@@ -225,20 +267,21 @@ class AppsScreen(Screen):
                 commands.extend(install_info.get('commands', []))
         
         # Build package install command
-        if packages:
-            if self.package_manager == 'apt':
-                commands.insert(0, f'apt install -y {" ".join(packages)}')
-            elif self.package_manager == 'dnf':
-                commands.insert(0, f'dnf install -y {" ".join(packages)}')
-            elif self.package_manager == 'pacman':
-                commands.insert(0, f'pacman -S --noconfirm {" ".join(packages)}')
+        install_command = PM_INSTALL_COMMANDS.get(self.package_manager)
+        if packages and install_command:
+            commands.insert(0, install_command.format(" ".join(packages)))
+        
+        background_commands = [
+            f'flatpak install -y --noninteractive {remote} {" ".join(refs)}'
+            for remote, refs in flatpak_refs.items()
+        ]
         
-        if not commands:
+        if not commands and not background_commands:
             self.app.notify("No installation commands to run!", severity="warning")
             return
         
         # Run in interactive terminal
-        description = f"Installing {len(selected)} application(s): {', '.join([app.name for app in selected])}"
+        description = f"Installing {len(selected)} application(s): {', '.join(app_names)}"
         
         # Suspend the app and run in terminal
         with self.app.suspend():
@@ -247,7 +290,8 @@ class AppsScreen(Screen):
                 commands=commands,
                 use_sudo=True,
                 description=description,
-                warning="This will install packages on your system."
+                warning="This will install packages on your system.",
+                background_commands=background_commands
             )
         
         # Show result
@@ -290,42 +334,19 @@ APPS_SCREEN_CSS = """
     margin: 1 0 0 0;
 }
 
-AppCheckbox {
+#app-details {
     height: auto;
-    margin: 0;
+    min-height: 3;
     padding: 0 1;
+    margin: 1 0 0 0;
+    color: $text-muted;
 }
 
-AppCheckbox:hover {
-    background: $boost;
-}
-
-AppCheckbox Vertical {
-    margin: 0 0 0 1;
-    padding: 0;
+.app-list {
     height: auto;
-}
-
-AppCheckbox Checkbox {
+    border: none;
     padding: 0;
-    width: auto;
-}
-
-AppCheckbox Label {
-    width: 1fr;
-    height: auto;
-}
-
-.app-name {
-    color: $text;
-    text-style: bold;
-    height: 1;
-}
-
-.app-description {
-    color: $text-muted;
-    text-style: italic;
-    height: 1;
+    margin: 0;
 }
 
 .pm-label {
@@ -4,49 +4,51 @@ System Tweaks Screen
 Displays system tweaks and optimizations that can be applied.
 """
 
+from typing import Iterator
+
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
-from textual.widgets import Header, Footer, Button, Static, Label, Checkbox
+from textual.widgets import Header, Footer, Button, Static, Label, SelectionList
+from textual.widgets.selection_list import Selection
 from textual.binding import Binding
 from textual.screen import Screen
 from textual import events
+from rich.text import Text
 
 from linutil.core.config_loader import TweakConfig, TweakDefinition
 from linutil.core.executor import PrivilegeHandler, CommandExecutor
 from linutil.core.terminal_executor import TerminalExecutor
 
 
-class TweakCheckbox(Horizontal):
-    """Custom checkbox widget for a system tweak."""
-    
-    def __init__(self, tweak: TweakDefinition):
-        super().__init__()
-        self.tweak = tweak
-        self.checkbox = Checkbox("", id=f"tweak_{self.tweak.id}")  # Empty label for checkbox
-    
-    def compose(self) -> ComposeResult:
-        """Create child widgets."""
-        yield self.checkbox
-        yield Vertical(
-            Label(f"{self.tweak.name} [{self.tweak.task_list}]", classes="tweak-name"),
-            Label(self.tweak.description, classes="tweak-description"),
-        )
-    
-    def on_click(self, event: events.Click) -> None:
-        """Toggle checkbox when clicking anywhere on the row except the checkbox itself."""
-        # Check if the click was on the checkbox widget itself
-        if event.widget is self.checkbox:
-            # Let the checkbox handle it naturally
-            return
-        
-        # Otherwise, toggle the checkbox
-        self.checkbox.toggle()
-        event.stop()  # Prevent event bubbling
+def tweak_prompt(tweak: TweakDefinition) -> Text:
+    """Build the list entry shown for a tweak."""
+    # Keep the restart warning ahead of the description so it is never cut off
+    restart_warning = ("  ⚠ Requires restart", "italic yellow") if tweak.requires_restart else ""
+    return Text.assemble(
+        (f"{tweak.name} [{tweak.task_list}]", "bold"),
+        restart_warning,
+        "  ",
+        (tweak.description, "italic dim"),
+    )
+
+
+def tweak_details(tweak: TweakDefinition) -> Text:
+    """Build the full description shown for the highlighted tweak."""
+    details = Text.assemble(
+        (tweak.name, "bold"),
+        f" [{tweak.task_list}]\n",
+        (tweak.description, "italic"),
+    )
+    if tweak.requires_restart:
+        details.append("\n⚠ Requires restart", style="italic yellow")
+    return details
 
 
 class TweaksScreen(Screen):
     """Screen for browsing and applying system tweaks."""
     
+    CSS_PATH = "tweaks_screen.tcss"
+    
     BINDINGS = [
         Binding("escape", "pop_screen", "Back"),
         Binding("q", "quit", "Quit"),
@@ -63,9 +65,19 @@ class TweaksScreen(Screen):
         super().__init__()
         self.tweaks_config = tweaks_config
         self.privilege_handler = privilege_handler
+        # Selection state lives in one SelectionList per section; rows are
+        # rendered line by line instead of being mounted as widgets.
+        self._tweak_lists: list[SelectionList[str]] = []
+        self._tweak_entries: dict[str, TweakDefinition] = {}
+        self._selected_ids: set[str] = set()
     
     def compose(self) -> ComposeResult:
         """Create child widgets."""
+        self._tweak_details = Static(
+            "Highlight a tweak to see its full description.",
+            id="tweak-details"
+        )
+        
         yield Header()
         
         yield Container(
@@ -84,11 +96,11 @@ class TweaksScreen(Screen):
                     classes="button-row"
                 ),
                 
-                # Scrollable tweaks list
-                ScrollableContainer(
-                    *self._create_tweak_sections(),
-                    id="tweaks-container"
-                ),
+                # Scrollable tweaks list, filled in on mount
+                ScrollableContainer(id="tweaks-container"),
+                
+                # Full description of the highlighted tweak
+                self._tweak_details,
                 
                 # Bottom buttons
                 Horizontal(
@@ -103,57 +115,42 @@ class TweaksScreen(Screen):
         
         yield Footer()
     
-    def _create_tweak_sections(self) -> list[Static | TweakCheckbox]:
-        """Create widgets for all tweak sections."""
-        widgets = []
+    def on_mount(self) -> None:
+        """Mount the tweak sections in a single batch."""
+        container = self.query_one("#tweaks-container", ScrollableContainer)
+        container.mount_all(self._iter_tweak_widgets())
+    
+    def _iter_tweak_widgets(self) -> Iterator[Static | Label | SelectionList[str]]:
+        """Yield widgets for all tweak sections."""
+        self._tweak_lists = []
+        self._tweak_entries = {}
         
         if not self.tweaks_config.sections:
-            widgets.append(
-                Static(
-                    "No tweaks available for your distribution yet.",
-                    classes="no-tweaks-message"
-                )
+            yield Static(
+                "No tweaks available for your distribution yet.",
+                classes="no-tweaks-message"
             )
-            return widgets
+            return
         
-        for section in self.tweaks_config.sections:
+        for section, tweaks in self.tweaks_config.get_sections():
             # Section header
             icon = section.get('icon', '🔧')
             name = section.get('name', 'Unknown')
-            tweaks = section.get('tweaks', [])
             
-            widgets.append(
-                Label(
-                    f"{icon} {name} ({len(tweaks)} tweaks)",
-                    classes="section-header"
-                )
+            yield Label(
+                f"{icon} {name} ({len(tweaks)} tweaks)",
+                classes="section-header"
             )
             
             # Tweaks in this section
-            for tweak_data in tweaks:
-                tweak = TweakDefinition(
-                    id=tweak_data["id"],
-                    name=tweak_data["name"],
-                    description=tweak_data["description"],
-                    category=tweak_data.get("category", ""),
-                    commands=tweak_data["commands"],
-                    requires_restart=tweak_data.get("requires_restart", False),
-                    idempotent=tweak_data.get("idempotent", True),
-                    dependencies=tweak_data.get("dependencies", []),
-                    verification=tweak_data.get("verification"),
-                    section=name,
-                    task_list=tweak_data.get("task_list", "I"),
-                )
-                
-                widgets.append(TweakCheckbox(tweak))
-                
-                # Show if restart required
-                if tweak.requires_restart:
-                    widgets.append(
-                        Label("  ⚠ Requires restart", classes="restart-warning")
-                    )
-        
-        return widgets
+            selections = []
+            for tweak in tweaks:
+                self._tweak_entries[tweak.id] = tweak
+                selections.append(Selection(tweak_prompt(tweak), tweak.id))
+            
+            tweak_list = SelectionList[str](*selections, classes="tweak-list")
+            self._tweak_lists.append(tweak_list)
+            yield tweak_list
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -169,17 +166,53 @@ class TweaksScreen(Screen):
             self.action_apply()
     
     def action_select_all(self) -> None:
-        """Select all tweak checkboxes."""
-        for checkbox in self.query(Checkbox):
-            checkbox.value = True
+        """Select all tweaks."""
+        with self.app.batch_update():
+            for tweak_list in self._tweak_lists:
+                tweak_list.select_all()
+        self._selected_ids = set(self._tweak_entries)
         self.app.notify("All tweaks selected", severity="information")
     
     def action_select_none(self) -> None:
-        """Deselect all tweak checkboxes."""
-        for checkbox in self.query(Checkbox):
-            checkbox.value = False
+        """Deselect all tweaks."""
+        with self.app.batch_update():
+            for tweak_list in self._tweak_lists:
+                tweak_list.deselect_all()
+        self._selected_ids.clear()
         self.app.notify("All selections cleared", severity="information")
     
+    def on_selection_list_selected_changed(
+        self,
+        event: SelectionList.SelectedChanged
+    ) -> None:
+        """Keep track of which tweaks are selected."""
+        self._selected_ids = {
+            tweak_id
+            for tweak_list in self._tweak_lists
+            for tweak_id in tweak_list.selected
+        }
+    
+    def _show_tweak_details(self, tweak_list: SelectionList[str]) -> None:
+        """Show the full description of a list's highlighted tweak."""
+        if tweak_list.highlighted is None:
+            return
+        tweak_id = tweak_list.get_option_at_index(tweak_list.highlighted).value
+        details = tweak_details(self._tweak_entries[tweak_id])
+        self._tweak_details.update(details)
+    
+    def on_selection_list_selection_highlighted(
+        self,
+        event: SelectionList.SelectionHighlighted
+    ) -> None:
+        """Follow the highlight in the focused list."""
+        if event.selection_list.has_focus:
+            self._show_tweak_details(event.selection_list)
+    
+    def on_descendant_focus(self, event: events.DescendantFocus) -> None:
+        """Show the highlighted tweak when a list gains focus."""
+        if isinstance(event.widget, SelectionList):
+            self._show_tweak_details(event.widget)
+    
     def action_pop_screen(self) -> None:
         """Go back to previous screen."""
         self.app.pop_screen()
@@ -188,22 +221,65 @@ class TweaksScreen(Screen):
         """Quit the application."""
         self.app.exit()
     
-    def action_apply(self) -> None:
-        """Apply selected tweaks interactively."""
-        # Collect selected tweaks
-        selected = []
+    def _order_by_dependencies(
+        self,
+        tweaks: list[TweakDefinition]
+    ) -> list[TweakDefinition]:
+        """
+        Order tweaks so each one runs after the selected tweaks it depends on.
         
-        for tweak_checkbox in self.query(TweakCheckbox):
-            if tweak_checkbox.checkbox.value:
-                selected.append(tweak_checkbox.tweak)
+        Tweaks are grouped into dependency waves, keeping the selection order
+        within a wave. Dependencies that were not selected are ignored and
+        tweaks caught in a dependency cycle are appended at the end.
+        
+        Args:
+            tweaks: Selected tweaks
+            
+        Returns:
+            Tweaks in the order they should be applied
+        """
+        selected_ids = {tweak.id for tweak in tweaks}
+        applied: set[str] = set()
+        ordered: list[TweakDefinition] = []
+        pending = tweaks
+        
+        while pending:
+            wave = [
+                tweak for tweak in pending
+                if all(
+                    dep in applied or dep not in selected_ids
+                    for dep in tweak.dependencies
+                )
+            ]
+            if not wave:
+                # Dependency cycle - fall back to selection order
+                ordered.extend(pending)
+                break
+            
+            ordered.extend(wave)
+            applied.update(tweak.id for tweak in wave)
+            pending = [tweak for tweak in pending if tweak.id not in applied]
         
-        if not selected:
+        return ordered
+    
+    def action_apply(self) -> None:
+        """Apply selected tweaks interactively."""
+        if not self._selected_ids:
             self.app.notify(
                 "No tweaks selected!",
                 severity="warning"
             )
             return
         
+        # Collect selected tweaks in display order
+        selected = [
+            tweak for tweak_id, tweak in self._tweak_entries.items()
+            if tweak_id in self._selected_ids
+        ]
+        
+        # Make sure dependencies are applied before the tweaks that need them
+        selected = self._order_by_dependencies(selected)
+        
         # Show selection count
         tweak_names = [tweak.name for tweak in selected]
         self.app.notify(
@@ -218,16 +294,18 @@ class TweaksScreen(Screen):
         
         for tweak in selected:
             # Add comments to separate each tweak
-            all_commands.append(f'echo "=== Applying: {tweak.name} ==="')
+            block = [f'echo "=== Applying: {tweak.name} ==="']
             
             for cmd_data in tweak.commands:
-                command = cmd_data.get('command', '')
-                description = cmd_data.get('description', '')
+                get = cmd_data.get
+                description = get('description', '')
                 
                 if description:
-                    all_commands.append(f'echo "  {description}..."')
+                    block.append(f'echo "  {description}..."')
                 
-                all_commands.append(command)
+                block.append(get('command', ''))
+            
+            all_commands.extend(block)
             
             if tweak.requires_restart:
                 requires_restart = True
@@ -237,9 +315,9 @@ class TweaksScreen(Screen):
             return
         
         # Build description
-        description = f"Applying {len(selected)} system tweak(s):\n"
-        for tweak in selected:
-            description += f"  • {tweak.name}\n"
+        lines = [f"Applying {len(selected)} system tweak(s):"]
+        lines.extend(f"  • {tweak.name}" for tweak in selected)
+        description = "\n".join(lines) + "\n"
         
         warning = None
         if requires_restart:
@@ -268,93 +346,3 @@ class TweaksScreen(Screen):
             else:
                 msg = "Tweak application cancelled or failed"
             self.app.notify(msg, severity="warning")
-    
-
-# CSS for the tweaks screen
-TWEAKS_SCREEN_CSS = """
-#tweaks-screen-container {
-    width: 90%;
-    max-width: 120;
-    height: 100%;
-    border: solid $accent;
-    padding: 1 2;
-}
-
-#tweaks-container {
-    height: 1fr;
-    border: solid $primary;
-    padding: 1;
-    margin: 0;
-}
-
-.section-header {
-    text-style: bold;
-    color: $accent;
-    background: $surface;
-    padding: 0 2;
-    margin: 1 0 0 0;
-}
-
-TweakCheckbox {
-    height: auto;
-    margin: 0;
-    padding: 0 1;
-}
-
-TweakCheckbox:hover {
-    background: $boost;
-}
-
-TweakCheckbox Vertical {
-    margin: 0 0 0 1;
-    padding: 0;
-    height: auto;
-}
-
-TweakCheckbox Checkbox {
-    padding: 0;
-    width: auto;
-}
-
-TweakCheckbox Label {
-    width: 1fr;
-    height: auto;
-}
-
-.tweak-name {
-    color: $text;
-    text-style: bold;
-    height: 1;
-}
-
-.tweak-description {
-    color: $text-muted;
-    text-style: italic;
-    height: 1;
-}
-
-.restart-warning {
-    color: $warning;
-    text-style: italic;
-    padding: 0 0 0 4;
-    margin: 0;
-    height: 1;
-}
-
-.subtitle {
-    text-align: center;
-    color: $text-muted;
-}
-
-.status-label {
-    text-align: center;
-    color: $warning;
-    text-style: bold;
-}
-
-.no-tweaks-message {
-    text-align: center;
-    color: $warning;
-    padding: 5;
-}
-"""
@@ -4,98 +4,101 @@ Keyboard Shortcuts Display
 Dynamic keyboard shortcuts guide shown at the bottom of screens.
 """
 
-from dataclasses import dataclass
-from typing import List
+import textwrap
+from dataclasses import dataclass, field
+from functools import cache
+from typing import List, Sequence, Tuple
 
+# Non-breaking space, which textwrap does not treat as a break point
+_NBSP = "\u00a0"
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Shortcut:
     """A keyboard shortcut with description and keys."""
     description: str
     keys: List[str]
+    _fmt: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Shortcuts are immutable, so format them once up front
+        keys_str = "/".join(self.keys)
+        object.__setattr__(self, "_fmt", f"[{keys_str}] {self.description}")
     
     def format(self) -> str:
         """Format the shortcut for display."""
-        keys_str = "/".join(self.keys)
-        return f"[{keys_str}] {self.description}"
+        return self._fmt
 
 
 class ShortcutGuide:
     """Manages keyboard shortcuts for different contexts."""
     
     @staticmethod
-    def welcome_screen() -> List[Shortcut]:
+    @cache
+    def welcome_screen() -> Tuple[Shortcut, ...]:
         """Shortcuts for the welcome screen."""
-        return [
+        return (
             Shortcut("Quit", ["q", "Ctrl-C"]),
             Shortcut("Install Apps", ["a"]),
             Shortcut("System Tweaks", ["t"]),
             Shortcut("Update System", ["u"]),
-        ]
+        )
     
     @staticmethod
-    def apps_screen() -> List[Shortcut]:
+    @cache
+    def apps_screen() -> Tuple[Shortcut, ...]:
         """Shortcuts for the apps screen."""
-        return [
+        return (
             Shortcut("Quit", ["q", "Ctrl-C"]),
             Shortcut("Back", ["Esc"]),
             Shortcut("Select All", ["a"]),
             Shortcut("Select None", ["n"]),
             Shortcut("Install", ["i"]),
-        ]
+        )
     
     @staticmethod
-    def tweaks_screen() -> List[Shortcut]:
+    @cache
+    def tweaks_screen() -> Tuple[Shortcut, ...]:
         """Shortcuts for the tweaks screen."""
-        return [
+        return (
             Shortcut("Quit", ["q", "Ctrl-C"]),
             Shortcut("Back", ["Esc"]),
             Shortcut("Select All", ["s"]),
             Shortcut("Select None", ["n"]),
             Shortcut("Apply", ["a"]),
-        ]
+        )
     
     @staticmethod
-    def update_screen() -> List[Shortcut]:
+    @cache
+    def update_screen() -> Tuple[Shortcut, ...]:
         """Shortcuts for the update screen."""
-        return [
+        return (
             Shortcut("Quit", ["q", "Ctrl-C"]),
             Shortcut("Back", ["Esc"]),
             Shortcut("Start Update", ["Enter"]),
-        ]
+        )
     
     @staticmethod
-    def format_shortcuts(shortcuts: List[Shortcut], max_width: int = 80) -> str:
+    def format_shortcuts(shortcuts: Sequence[Shortcut], max_width: int = 80) -> str:
         """
         Format shortcuts for display with wrapping.
         
         Args:
-            shortcuts: List of shortcuts to format
+            shortcuts: Shortcuts to format
             max_width: Maximum width of output line
             
         Returns:
             Formatted string with shortcuts
         """
-        formatted = []
-        current_line = []
-        current_length = 0
-        
-        for shortcut in shortcuts:
-            formatted_shortcut = shortcut.format()
-            shortcut_length = len(formatted_shortcut)
-            
-            # Check if adding this shortcut would exceed max width
-            if current_line and current_length + shortcut_length + 3 > max_width:
-                # Start a new line
-                formatted.append("  ".join(current_line))
-                current_line = [formatted_shortcut]
-                current_length = shortcut_length
-            else:
-                current_line.append(formatted_shortcut)
-                current_length += shortcut_length + 3  # +3 for separator
-        
-        # Add the last line
-        if current_line:
-            formatted.append("  ".join(current_line))
-        
-        return "\n".join(formatted)
+        # Glue the words of each shortcut together so lines only break
+        # between shortcuts, never inside one
+        text = "  ".join(
+            shortcut.format().replace(" ", _NBSP) for shortcut in shortcuts
+        )
+        lines = textwrap.wrap(
+            text,
+            width=max_width,
+            break_long_words=False,
+            break_on_hyphens=False,
+        )
+        return "\n".join(lines).replace(_NBSP, " ")
@@ -5,6 +5,8 @@ This module provides documentation for the task list indicator system
 used in LinUtil, inspired by Chris Titus Tech's LinUtil.
 """
 
+from functools import lru_cache
+
 # Task List Indicators
 # These indicators help users understand what operations a command will perform
 # They appear next to each application/tweak in brackets, e.g., "Firefox [I]"
@@ -82,6 +84,10 @@ TASK_INDICATORS = {
     }
 }
 
+# Flat lookups of the fields used when aggregating a task list
+_REQUIRES_SUDO = {code: info["requires_sudo"] for code, info in TASK_INDICATORS.items()}
+_TASK_NAME = {code: info["name"] for code, info in TASK_INDICATORS.items()}
+
 
 def get_task_description(task_code: str) -> str:
     """
@@ -97,6 +103,7 @@ def get_task_description(task_code: str) -> str:
     return task_info.get("description", "Unknown task")
 
 
+@lru_cache(maxsize=256)
 def get_combined_task_description(task_list: str) -> str:
     """
     Get combined description for multiple task indicators.
@@ -107,16 +114,14 @@ def get_combined_task_description(task_list: str) -> str:
     Returns:
         Combined description of all tasks
     """
-    tasks = task_list.split()
-    descriptions = []
-    
-    for task in tasks:
-        if task in TASK_INDICATORS:
-            descriptions.append(TASK_INDICATORS[task]["name"])
+    descriptions = [
+        _TASK_NAME[task] for task in task_list.split() if task in _TASK_NAME
+    ]
     
     return " + ".join(descriptions) if descriptions else "Unknown"
 
 
+@lru_cache(maxsize=256)
 def requires_sudo(task_list: str) -> bool:
     """
     Check if any task in the list requires sudo privileges.
@@ -127,11 +132,7 @@ def requires_sudo(task_list: str) -> bool:
     Returns:
         True if any task requires sudo
     """
-    tasks = task_list.split()
-    return any(
-        TASK_INDICATORS.get(task, {}).get("requires_sudo", False)
-        for task in tasks
-    )
+    return any(_REQUIRES_SUDO.get(task, False) for task in task_list.split())
 
 
 # Example Usage in YAML:
@@ -4,6 +4,9 @@ Modern UI Theme for LinUtil
 Professional color scheme and styling configurations.
 """
 
+from types import MappingProxyType
+from typing import Final, Mapping
+
 # Modern color palette inspired by popular TUI applications
 THEME_CSS = """
 /* ============================================ */
@@ -156,7 +159,6 @@ Button.-error:hover {
 
 .screen-title {
     text-align: center;
-    text-style: bold;
     color: $accent;
     margin: 0;
     text-style: bold underline;
@@ -172,7 +174,9 @@ Button.-error:hover {
 /*             UPDATE SCREEN                   */
 /* ============================================ */
 
-#update-container {
+#update-container,
+#apps-screen-container,
+#tweaks-container {
     width: 90%;
     max-width: 120;
     height: 100%;
@@ -211,23 +215,7 @@ Button.-error:hover {
     margin: 1 0;
 }
 
-.category-label {
-    color: $accent;
-    text-style: bold;
-    background: $surface;
-    padding: 0 1;
-    margin: 0;
-    border: tall $border;
-}
-
-.category-header {
-    text-style: bold;
-    color: $accent;
-    background: $surface;
-    padding: 0 1;
-    margin: 0;
-}
-
+.category-header,
 .section-header {
     text-style: bold;
     color: $accent;
@@ -236,12 +224,7 @@ Button.-error:hover {
     margin: 0;
 }
 
-.no-apps-message {
-    text-align: center;
-    color: $warning;
-    padding: 5;
-}
-
+.no-apps-message,
 .no-tweaks-message {
     text-align: center;
     color: $warning;
@@ -254,180 +237,32 @@ Button.-error:hover {
     margin: 0;
 }
 
-.restart-warning {
-    color: $warning;
-    text-style: italic;
-    padding: 0 0 0 4;
-    margin: 0;
-    height: 1;
-}
-
-#apps-screen-container {
-    width: 90%;
-    max-width: 120;
-    height: 100%;
-    background: $surface;
-    border: round $border-accent;
-    padding: 2 3;
-}
-
-.app-checkbox-container {
-    background: transparent;
-    padding: 1 2;
-    margin: 0;
-    border: none;
-}
-
-.app-checkbox-container:hover {
-    background: $surface;
-    border: tall $border;
-}
-
-.app-name {
-    color: $text;
-    text-style: bold;
-    margin: 0;
-}
-
-.app-description {
-    color: $text-muted;
-    margin: 0 0 0 2;
-}
-
-AppCheckbox {
-    width: 100%;
-    height: auto;
-    background: transparent;
-    padding: 0;
-    margin: 0;
-}
-
-AppCheckbox:hover {
-    background: $surface;
-}
-
-AppCheckbox Checkbox {
-    width: auto;
-}
-
-AppCheckbox Vertical {
-    width: 1fr;
-    margin: 0 0 0 1;
-    padding: 0;
-}
-
-/* ============================================ */
-/*             TWEAKS SCREEN                   */
-/* ============================================ */
-
-#tweaks-container {
-    width: 90%;
-    max-width: 120;
-    height: 100%;
-    background: $surface;
-    border: round $border-accent;
-    padding: 2 3;
-}
-
-#tweaks-list-container {
-    height: 1fr;
-    border: round $border;
-    background: $surface-light;
-    padding: 1;
-    margin: 1 0;
-}
-
-.tweak-checkbox-container {
-    background: transparent;
-    padding: 0;
-    margin: 0;
-    border: none;
-}
-
-.tweak-checkbox-container:hover {
-    background: $surface;
-    border: tall $border;
-}
-
-.tweak-name {
-    color: $text;
-    text-style: bold;
-    margin: 0;
-}
-
-.tweak-description {
-    color: $text-muted;
-    margin: 0 0 0 2;
-}
-
-TweakCheckbox {
-    width: 100%;
-    height: auto;
-    background: transparent;
-    padding: 0;
-    margin: 0;
-}
-
-TweakCheckbox:hover {
-    background: $surface;
-}
-
-TweakCheckbox Checkbox {
-    width: auto;
-}
-
-TweakCheckbox Vertical {
-    width: 1fr;
-    margin: 0 0 0 1;
-    padding: 0;
-}
-
-/* ============================================ */
-/*             CHECKBOXES                      */
-/* ============================================ */
-
-Checkbox {
-    background: transparent;
-    border: none;
-    padding: 0;
-    width: auto;
-}
-
-Checkbox:focus {
-    background: $surface;
-}
-
-Checkbox > .toggle--label {
-    color: $text;
-    margin: 0 1;
-}
-
 /* ============================================ */
 /*             TIPS & HINTS                    */
 /* ============================================ */
 
-.tip-text {
+.tip-text,
+.shortcuts-guide,
+.hint {
     text-align: center;
-    color: $warning;
     text-style: italic;
     margin: 1 0 0 0;
+}
+
+.tip-text {
+    color: $warning;
     background: $surface-light;
     padding: 1;
     border: tall $border;
 }
 
 .shortcuts-guide {
-    text-align: center;
     color: $text-muted;
-    text-style: italic;
-    margin: 1 0 0 0;
     padding: 0;
 }
 
 .hint {
-    text-align: center;
     color: $text-muted;
-    text-style: italic;
     margin: 1 0;
 }
 
@@ -491,14 +326,6 @@ ScrollableContainer:focus {
     border: tall $border-accent;
 }
 
-Vertical:focus {
-    border: none;
-}
-
-Horizontal:focus {
-    border: none;
-}
-
 /* ============================================ */
 /*             LOADING STATES                  */
 /* ============================================ */
@@ -516,22 +343,13 @@ LoadingIndicator {
     opacity: 0.5;
 }
 
-*:focus {
+OptionList:focus {
     border: tall $border-accent;
 }
-
-Static:focus {
-    border: none;
-}
-
-Label:focus {
-    border: none;
-}
 """
 
-
 # Icon/Symbol sets for different UI elements
-ICONS = {
+ICONS: Final[Mapping[str, str]] = MappingProxyType({
     # Navigation
     "back": "◀",
     "forward": "▶",
@@ -567,7 +385,7 @@ ICONS = {
     "gaming": "🎮",
     "utility": "🔧",
     "system": "⚙",
-}
+})
 
 
 def get_icon(name: str) -> str:
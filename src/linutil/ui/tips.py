@@ -4,9 +4,11 @@ Linux Command Tips
 Random helpful Linux tips displayed to users.
 """
 
-import random
+from functools import cache
+from itertools import cycle
+from typing import Iterator
 
-LINUX_TIPS = [
+LINUX_TIPS = (
     "Use 'htop' for an interactive process viewer instead of 'top'",
     "Press Ctrl+R to search through your command history",
     "Use 'cd -' to quickly switch to your previous directory",
@@ -37,9 +39,24 @@ LINUX_TIPS = [
     "The 'xargs' command builds commands from standard input",
     "Use 'journalctl -f' to follow system logs in real-time",
     "The 'ncdu' tool provides an interactive disk usage analyzer",
-]
+)
+
+
+@cache
+def _tip_cycle() -> Iterator[str]:
+    """Shuffle the tips once, on first use, and cycle through them."""
+    # Only pay for importing random when a tip is actually shown
+    from random import Random
+    order = list(LINUX_TIPS)
+    Random().shuffle(order)
+    return cycle(order)
 
 
 def get_random_tip() -> str:
-    """Get a random Linux tip."""
-    return random.choice(LINUX_TIPS)
+    """
+    Get a random Linux tip.
+    
+    Every tip is shown once before any tip repeats, and the same tip is
+    never returned twice in a row.
+    """
+    return next(_tip_cycle())